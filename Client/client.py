@@ -1,14 +1,110 @@
 #pylint: disable= W0238 C0103 C0301
 
+from functools import lru_cache, partial
 from time import sleep
 from enum import Enum
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
+import math
 import socket
-import json
 import sys
+import msgpack
 from prettytable import PrettyTable
+from wcwidth import wcswidth
 
-from utils import server_config, LinkedStack
+from utils import server_config, send_framed, recv_framed
+
+_dumps = partial(msgpack.packb, use_bin_type=True)
+_loads = partial(msgpack.unpackb, raw=False)
+
+
+_COLOR = {2: "\033[92m", 1: "\033[93m", 0: "\033[90m"}
+_RESET = "\033[0m"
+
+_WELCOME = f"\n{'=' * 50}\nBem vindo ao jogo de palavras Termo!\n{'=' * 50}"
+_EXIT_HINT = "\033[90mPressione Ctrl + C para sair do jogo!\033[0m"
+_END_GAME = "\nA rodada acabou! Deseja continuar jogando?"
+
+
+@lru_cache(maxsize=256)
+def _wrap(char: str, code: int) -> str:
+    """
+    Envolve um caractere com a cor ANSI correspondente ao seu código de formatação.
+    """
+    return f"{_COLOR.get(code, _COLOR[0])}{char}{_RESET}"
+
+
+_CMD_TABLE = {
+    '1': ("start_game", "name", False),
+    '2': ("exit_game", "none", False),
+    '3': ("check_word", "input", True),
+    '4': ("list_words", "none", True),
+    '5': ("restart_game", "name", True),
+}
+
+_END_GAME_OPTIONS = frozenset({'1', '2'})
+
+
+def _center(text: str, width: int) -> str:
+    """
+    Centraliza o texto considerando sua largura de exibição no terminal,
+    distribuindo o espaço excedente da mesma forma que o PrettyTable.
+    """
+    text_width = wcswidth(text)
+    excess = width - text_width
+
+    if excess % 2 == 0:
+        left = excess // 2
+    elif text_width % 2:
+        left = excess // 2
+    else:
+        left = excess // 2 + 1
+
+    return " " * left + text + " " * (excess - left)
+
+
+def _render_scores(name: str, rounds_scores: dict, total: float) -> str:
+    """
+    Monta a tabela de pontuação das rodadas no mesmo formato das tabelas do menu.
+
+    Args:
+        name (str): O nome do jogador.
+        rounds_scores (dict): As pontuações de cada rodada.
+        total (float): A pontuação total do jogador.
+
+    Returns:
+        str: A tabela de pontuação renderizada.
+    """
+    headers = list(rounds_scores) + ["Pontuação Total"]
+    values = list(map(str, rounds_scores.values())) + [str(total)]
+    widths = [max(wcswidth(h), wcswidth(v)) for h, v in zip(headers, values)]
+
+    title = f"Pontuação de {name}"
+
+    # Assim como o PrettyTable, distribui proporcionalmente entre as colunas
+    # a largura extra necessária para comportar o título.
+    min_content_width = wcswidth(title) + 4 - (3 * len(widths) + 1)
+    content_width = sum(widths)
+
+    if content_width < min_content_width:
+        scale = min_content_width / content_width
+        widths = [math.floor(w * scale) for w in widths]
+        widths[-1] += min_content_width - sum(widths)
+
+    border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    inner_width = len(border) - 4
+
+    def row(cells):
+        return "| " + " | ".join(_center(c, w) for c, w in zip(cells, widths)) + " |"
+
+    return "\n".join((
+        "+" + "-" * (inner_width + 2) + "+",
+        "| " + _center(title, inner_width) + " |",
+        border,
+        row(headers),
+        border,
+        row(values),
+        border,
+    ))
 
 
 class GameStatus(Enum):
@@ -20,6 +116,11 @@ class GameStatus(Enum):
     GAME_FINISHED = 3
 
 
+_NO_GAME = GameStatus.NO_GAME
+_IN_PROGRESS = GameStatus.GAME_IN_PROGRESS
+_FINISHED = GameStatus.GAME_FINISHED
+
+
 class Client:
     """
         Inicializa a classe Client.
@@ -28,11 +129,35 @@ class Client:
         self.__HOST: str = '127.0.0.1'
         self.__MSG_SIZE, self.__PORT = server_config()
         self.__sock: socket.socket = None
-        self.__game_status: GameStatus = GameStatus.NO_GAME
+        self.__MAX_RESPONSE_SIZE: int = 65536
+        self.__recv_buf: bytearray = bytearray(self.__MSG_SIZE)
+        self.__game_status: GameStatus = _NO_GAME
+        self.__cached_requests: Dict[str, bytes] = {
+            command: _dumps(self.__create_request_body(command, None))
+            for command in ("exit_game", "list_words", "continue_game")
+        }
         self.__user_name: str = None
-        self.__words_stack = LinkedStack()
-        self.__table = PrettyTable()
-        self.__scores_table = PrettyTable()
+        self.__words_stack: List[str] = []
+        self.__menu_str_no_game: str = self.__build_menu_table(in_game=False)
+        self.__menu_str_in_game: str = self.__build_menu_table(in_game=True)
+        self.__success_handlers = {
+            200: self.__on_200,
+            201: self.__on_201,
+            202: self.__on_202,
+            203: self.__on_203,
+            204: self.__on_204,
+            205: self.__on_205,
+            206: self.__on_206,
+        }
+        self.__error_handlers = {
+            400: self.__on_400,
+            401: self.__on_401,
+            402: self.__on_402,
+            403: self.__on_403,
+            404: self.__on_404,
+            405: self.__on_405,
+            499: self.__on_499,
+        }
 
     def __connect_to_server(self) -> socket.socket:
         """
@@ -48,15 +173,21 @@ class Client:
             socket.error: Se não for possível estabelecer a conexão 
             com o servidor após 5 tentativas.
         """
-        for _ in range(5):
+        for attempt in range(5):
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.connect((self.__HOST, self.__PORT))
+                sock = socket.create_connection((self.__HOST, self.__PORT), timeout=2.0)
+                sock.settimeout(None)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
                 return sock
-            except socket.error:
+            except OSError:
+                if attempt == 4:
+                    break
+
+                delay = 0.5 * (2 ** attempt)
                 try:
-                    print("Erro ao conectar ao servidor. Tentando novamente em 5 segundos.")
-                    sleep(5)
+                    print(f"Erro ao conectar ao servidor. Tentando novamente em {delay} segundos.")
+                    sleep(delay)
                 except KeyboardInterrupt:
                     print("Encerrando o Termo!")
                     exit(0)
@@ -64,50 +195,46 @@ class Client:
         raise socket.error("Não foi possível conectar ao servidor. Tente reiniciar o cliente.")
 
 
-    def __render_menu_table(self) -> None:
+    def __build_menu_table(self, in_game: bool) -> str:
         """
-        Renderiza uma tabela com as opções disponíveis para o usuário.
+        Constrói a tabela de opções do menu e retorna sua versão renderizada.
 
         Args:
-            self: A referência para a instância da classe.
+            in_game (bool): Indica se as opções de jogo em andamento devem ser incluídas.
 
+        Returns:
+            str: A tabela de opções renderizada.
         """
-        self.__table.clear_rows()
-        self.__table.field_names = ["Opção", "Descrição"]
-        self.__table.add_row(["1", "Começar um jogo"])
-        self.__table.add_row(["2", "Sair do jogo atual"])
+        table = PrettyTable(["Opção", "Descrição"], align="l")
+        rows = [["1", "Começar um jogo"], ["2", "Sair do jogo atual"]]
 
-        if self.__game_status != GameStatus.NO_GAME:
-            self.__table.add_row(["3", "Verificar palavra"])
-            self.__table.add_row(["4", "Listar palavras digitadas nesta rodada"])
-            self.__table.add_row(["5", "Reiniciar o jogo atual"])
+        if in_game:
+            rows += [
+                ["3", "Verificar palavra"],
+                ["4", "Listar palavras digitadas nesta rodada"],
+                ["5", "Reiniciar o jogo atual"],
+            ]
 
-        self.__table.align["Opção"] = "l"
-        self.__table.align["Descrição"] = "l"
+        table.add_rows(rows)
 
-        print("")
-        print(self.__table)
+        return str(table)
 
 
-    def __render_score_table(self, rounds_scores:dict, total_score:float) -> str:
+    def __render_menu_table(self) -> None:
         """
-        Renderiza uma tabela com os scores das rodadas.
+        Renderiza uma tabela com as opções disponíveis para o usuário.
 
         Args:
             self: A referência para a instância da classe.
 
         """
-        self.__scores_table.clear_rows()
-        self.__scores_table.title = f"Pontuação de {self.__user_name}"
-        self.__scores_table.field_names = list(rounds_scores.keys())
-        self.__scores_table.add_row(list(rounds_scores.values()))
-        self.__scores_table.add_column("Pontuação Total", [total_score])
-    
-        self.__scores_table.align["Rodada"] = "c"
-        self.__scores_table.align["Pontuação Total"] = "c"
+        if self.__game_status is _NO_GAME:
+            menu = self.__menu_str_no_game
+        else:
+            menu = self.__menu_str_in_game
 
         print("")
-        print(self.__scores_table)
+        print(menu)
 
 
     def __process_user_command(self, user_command: str) -> Tuple[str, Any]:
@@ -124,29 +251,21 @@ class Client:
         Raises:
             ValueError: Se o comando fornecido pelo usuário for inválido.
         """
-        if user_command == '1':
-            command = "start_game"
-            parameter = self.__user_name
+        name = self.__user_name
+        in_progress = self.__game_status is _IN_PROGRESS
+        entry = _CMD_TABLE.get(user_command)
 
-        elif user_command == '2':
-            command = "exit_game"
-            parameter = None
-
-        elif user_command == '3' and self.__game_status == GameStatus.GAME_IN_PROGRESS:
-            command = "check_word"
-            user_input = input('Digite uma palavra: ')
-            parameter = user_input.lower()
-
-        elif user_command == '4' and self.__game_status == GameStatus.GAME_IN_PROGRESS:
-            command = "list_words"
-            parameter = None
+        if entry is None or (entry[2] and not in_progress):
+            raise ValueError("Comando inválido:" + " " + user_command)
 
-        elif user_command == '5' and self.__game_status == GameStatus.GAME_IN_PROGRESS:
-            command = "restart_game"
-            parameter = self.__user_name
+        command, parameter_kind, _ = entry
 
+        if parameter_kind == "name":
+            parameter = name
+        elif parameter_kind == "input":
+            parameter = input('Digite uma palavra: ').lower()
         else:
-            raise ValueError("Comando inválido:" + " " + user_command)
+            parameter = None
 
         return (command, parameter)
 
@@ -163,13 +282,42 @@ class Client:
 
         Raises:
             OSError: Se ocorrer um erro ao enviar ou receber dados pelo socket.
-            json.JSONDecodeError: Se ocorrer um erro ao decodificar a resposta do servidor.
+            ValueError: Se ocorrer um erro ao decodificar a resposta do servidor.
+        """
+        return self.__send_payload(_dumps(req_body))
+
+
+    def __send_payload(self, payload: bytes) -> Dict[str, Any]:
+        """
+        Envia uma requisição já serializada para o servidor e lê a resposta.
+
+        Args:
+            payload (bytes): O corpo da requisição já serializado.
+
+        Returns:
+            Dict[str, Any]: Os dados da resposta do servidor em formato de dicionário.
+
+        Caso a conexão seja encerrada ou a resposta não possa ser lida por completo,
+        o socket é fechado e o programa encerrado.
+
+        Raises:
+            OSError: Se ocorrer um erro ao enviar ou receber dados pelo socket.
+            ValueError: Se a requisição exceder o tamanho máximo aceito pelo servidor
+            ou se ocorrer um erro ao decodificar a resposta do servidor.
         """
-        json_data = json.dumps(req_body)
-        self.__sock.sendall(json_data.encode())
+        if len(payload) > self.__MSG_SIZE:
+            raise ValueError(f"Comando inválido: a requisição excede o limite de {self.__MSG_SIZE} bytes.")
+
+        try:
+            send_framed(self.__sock, payload)
+            response = recv_framed(self.__sock, self.__MAX_RESPONSE_SIZE, self.__recv_buf)
+        except ConnectionError as e:
+            self.__handle_connection_lost(str(e))
 
-        response = self.__sock.recv(self.__MSG_SIZE)
-        response_data = json.loads(response)
+        if response is None:
+            self.__handle_connection_lost("O servidor encerrou a conexão.")
+
+        response_data = _loads(response)
         return response_data
 
 
@@ -177,7 +325,7 @@ class Client:
         """
         Exibe uma mensagem de boas-vindas.
         """
-        print(f"\n{'=' * 50}\nBem vindo ao jogo de palavras Termo!\n{'=' * 50}")
+        print(_WELCOME)
 
 
     def __get_username(self) -> str:
@@ -198,21 +346,36 @@ class Client:
         """
         Exibe a mensagem de instrução para caso o jogador deseje encerrar o jogo.
         """
-        print("\033[90mPressione Ctrl + C para sair do jogo!\033[0m")
+        print(_EXIT_HINT)
 
 
     def __print_end_game_message(self) -> None:
         """
         Exibe uma mensagem de fim de jogo.
         """
-        print("\nA rodada acabou! Deseja continuar jogando?")
+        print(_END_GAME)
 
 
     def __print_goodbye_message(self) -> None:
         """
         Exibe uma mensagem de despedida.
         """
-        print(f'\nAté a próxima, {self.__user_name}! Obrigado por jogar o Termo!')
+        print("\nAté a próxima, " + self.__user_name + "! Obrigado por jogar o Termo!")
+
+
+    def __handle_connection_lost(self, reason: str) -> None:
+        """
+        Lida com a perda ou dessincronização da conexão com o servidor.
+
+        Fecha o socket e encerra o programa, já que não é possível continuar
+        lendo respostas de uma conexão encerrada ou fora de sincronia.
+
+        Args:
+            reason (str): O motivo da perda de conexão.
+        """
+        print(f"\033[91m{reason} Encerrando o Termo!\033[0m")
+        self.__sock.close()
+        sys.exit(1)
 
 
     def __handle_keyboard_interrupt(self) -> None:
@@ -222,7 +385,7 @@ class Client:
         Fecha o socket e encerra o programa com uma mensagem.
 
         """
-        print(f"\nObrigado por jogar {self.__user_name}!\n Foi feito com ❤️  em 🐍\n")
+        print("\nObrigado por jogar " + self.__user_name + "!\n Foi feito com ❤️  em 🐍\n")
         self.__sock.close()
         sys.exit(0)
 
@@ -253,8 +416,15 @@ class Client:
         """
         usr_input =  input('Digite 1 para continuar ou 2 para sair: ')
 
-        while usr_input not in ['1', '2']:
-            usr_input = input('Digite uma opção válida (1/2): ')
+        while usr_input not in _END_GAME_OPTIONS:
+            sys.stdout.write('Digite uma opção válida (1/2): ')
+            sys.stdout.flush()
+
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+
+            usr_input = line.rstrip('\n')
 
         return usr_input
 
@@ -287,10 +457,10 @@ class Client:
         
         """
         if option == '1':
-            self.__game_status = GameStatus.GAME_IN_PROGRESS
+            self.__game_status = _IN_PROGRESS
             return False
 
-        self.__game_status = GameStatus.GAME_FINISHED
+        self.__game_status = _FINISHED
         return True
 
 
@@ -304,16 +474,11 @@ class Client:
 
         Raises:
             OSError: Ocorre quando há um erro ao enviar ou receber dados pelo socket.
-            json.JSONDecodeError: Ocorre quando há um erro ao decodificar a resposta do servidor.
+            ValueError: Ocorre quando há um erro ao decodificar a resposta do servidor.
         """
-        req_body = {
-            "command": "continue_game",
-            "parameter": None
-        }
-
         for _ in range(3):
             try:
-                response_data = self.__send_requisition(req_body)
+                response_data = self.__send_payload(self.__cached_requests["continue_game"])
                 response_status = response_data["status_code"]
 
                 self.__render_response(response_status, player_name=self.__user_name)
@@ -322,7 +487,7 @@ class Client:
             except OSError:
                 print("Ocorreu um erro ao enviar ou receber dados pelo socket.")
 
-            except json.JSONDecodeError:
+            except ValueError:
                 print("Ocorreu um erro ao decodificar a resposta do servidor.")
 
         print("Ocorreu um erro ao continuar o jogo. Por favor, considere reiniciar")
@@ -339,19 +504,8 @@ class Client:
         Returns:
             str: A string formatada.
         """
-        if word and format_instructions:
-            output = ''
-            for index, items in enumerate(format_instructions):
-                if items == 2:
-                    output += "\033[92m" + word[index] + "\033[0m"
-                elif items == 1:
-                    output += "\033[93m" + word[index] + "\033[0m"
-                else:
-                    output += "\033[90m" + word[index] + "\033[0m"
+        return "".join(_wrap(char, code) for char, code in zip(word, format_instructions))
 
-            return output
-
-        return
 
     def __secret_word_animation(self, word) -> None:
         """
@@ -361,13 +515,10 @@ class Client:
             word (str): A palavra secreta a ser exibida.
 
         """
-        transformed_word = ['_' for _ in word]
-
         print("Você não conseguiu acertar a palavra secreta!\nA palavra era:\n")
 
-        for i, char in enumerate(word):
-            transformed_word[i] = char
-            print(''.join(transformed_word))
+        for i in range(len(word)):
+            print(word[:i + 1] + "_" * (len(word) - i - 1))
             sleep(1)
 
 
@@ -382,98 +533,162 @@ class Client:
 
         """
         if 200 <= response_status < 400:
-            self.__handle_successful_cases(response_status, **extra_info)
+            handlers = self.__success_handlers
 
         elif 400 <= response_status < 500:
-            self.__handle_error_cases(response_status, **extra_info)
+            handlers = self.__error_handlers
+
+        else:
+            return
 
+        handlers.get(response_status, self.__noop)(**extra_info)
 
-    def __handle_successful_cases(self, response_status, **extra_info):
+
+    def __noop(self, **_extra_info):
+        """
+        Ignora códigos de status sem tratamento específico.
         """
-        Lida com os casos de sucesso com base no código de status da resposta.
 
-        Args:
-            response_status (int): O código de status da resposta.
-            **extra_info: Informações adicionais passadas como argumentos de palavra-chave.
 
+    def __on_200(self, **_extra_info):
+        """
+        Jogo iniciado.
+        """
+        print("Jogo Iniciado com Sucesso")
+
+
+    def __on_201(self, **_extra_info):
+        """
+        Jogo finalizado.
+        """
+        print("Jogo Finalizado com Sucesso")
+
+
+    def __on_202(self, **extra_info):
+        """
+        Palavra correta: exibe as palavras da rodada e a pontuação.
+        """
+        words = ", ".join(self.__words_stack)
+        print(f'\n🏆 Parabéns! Palavra Correta! 😎\nLista de Palavras Anteriores:\n{words}\n{self.__return_attempts(extra_info.get("remaining_attempts"))}')
+        print("")
+        print(_render_scores(self.__user_name, extra_info.get("rounds_scores"), extra_info.get("total_score")))
+        self.__words_stack.clear()
+
+
+    def __on_203(self, **extra_info):
+        """
+        Palavra incorreta: exibe a palavra formatada e, se as tentativas acabaram,
+        revela a palavra secreta e a pontuação.
         """
-        remaining_attempts = extra_info.get("remaining_attempts")
         format_output = extra_info.get("format_output")
-        secret_word = extra_info.get("secret_word")
-        player_name = extra_info.get("player_name")
+        remaining_attempts = extra_info.get("remaining_attempts")
 
-        match response_status:
-            case 200:
-                print("Jogo Iniciado com Sucesso")
+        self.__words_stack.append(format_output)
 
-            case 201:
-                print("Jogo Finalizado com Sucesso")
+        print(f"\nPalavra Incorreta!\n{format_output}\n{self.__return_attempts(remaining_attempts)}")
 
-            case 202:
-                print(f'\n🏆 Parabéns! Palavra Correta! 😎\nLista de Palavras Anteriores:\n{(self.__words_stack)}\n{self.__return_attempts(remaining_attempts)}')
-                self.__render_score_table(extra_info.get("rounds_scores"), extra_info.get("total_score"))
-                self.__words_stack.clear()
+        if remaining_attempts == 0:
+            self.__words_stack.clear()
+            self.__secret_word_animation(extra_info.get("secret_word"))
+            print("")
+            print(_render_scores(self.__user_name, extra_info.get("rounds_scores"), extra_info.get("total_score")))
 
-            case 203:
-                self.__words_stack.stack_up(format_output)
 
-                print(f"\nPalavra Incorreta!\n{format_output}\n{self.__return_attempts(remaining_attempts)}")
+    def __on_204(self, **_extra_info):
+        """
+        Lista as palavras digitadas na rodada.
+        """
+        if self.__words_stack:
+            print(f"Lista de Palavras:\n{', '.join(self.__words_stack)}")
+        else:
+            print("Não há palavras inseridas nesta rodada!")
 
-                if remaining_attempts == 0:
-                    self.__words_stack.clear()
-                    self.__secret_word_animation(secret_word)
-                    self.__render_score_table(extra_info.get("rounds_scores"), extra_info.get("total_score"))
 
-            case 204:
-                if self.__words_stack:
-                    print(f"Lista de Palavras:\n{self.__words_stack}")
-                else:
-                    print("Não há palavras inseridas nesta rodada!")
+    def __on_205(self, **_extra_info):
+        """
+        Jogo reiniciado.
+        """
+        print("Jogo reiniciado com sucesso")
+        self.__words_stack.clear()
 
-            case 205:
-                print("Jogo reiniciado com sucesso")
-                self.__words_stack.clear()
 
-            case 206:
-                print(f"Jogo Continuado com Sucesso, Boa Sorte na Próxima Rodada {player_name}!")
+    def __on_206(self, **extra_info):
+        """
+        Jogo continuado.
+        """
+        print(f"Jogo Continuado com Sucesso, Boa Sorte na Próxima Rodada {extra_info.get('player_name')}!")
 
 
-    def __handle_error_cases(self, response_status, **remaining_attempts):
+    def __on_400(self, **_extra_info):
         """
-        Manipula os casos de erro de resposta do servidor.
+        Jogo já iniciado.
+        """
+        print("Jogo já iniciado")
+
+
+    def __on_401(self, **_extra_info):
+        """
+        Jogo não iniciado.
+        """
+        print("Jogo não iniciado")
+
+
+    def __on_402(self, **extra_info):
+        """
+        Palavra não informada.
+        """
+        print(f"É necessário digitar uma palavra\n{self.__return_attempts(extra_info.get('remaining_attempts'))}")
+
+
+    def __on_403(self, **extra_info):
+        """
+        Palavra com tamanho incorreto.
+        """
+        print(f"A palavra deve ter 5 letras\n{self.__return_attempts(extra_info.get('remaining_attempts'))}")
 
-        Args:
-            response_status (int): O código de status da resposta.
-            remaining_attempts (dict): Dicionário contendo as tentativas restantes.
 
+    def __on_404(self, **extra_info):
+        """
+        Palavra inexistente no dicionário.
         """
-        remaining_attempts = remaining_attempts.get("remaining_attempts")
+        print(f'A palavra não existe no dicionário\n{self.__return_attempts(extra_info.get("remaining_attempts"))}')
 
-        match response_status:
-            case 400:
-                print("Jogo já iniciado")
 
-            case 401:
-                print("Jogo não iniciado")
+    def __on_405(self, **extra_info):
+        """
+        Palavra repetida.
+        """
+        print(f'Palavra já utilizada\n{self.__return_attempts(extra_info.get("remaining_attempts"))}')
 
-            case 402:
-                print(f"É necessário digitar uma palavra\n{self.__return_attempts(remaining_attempts)}")
 
-            case 403:
-                print(f"A palavra deve ter 5 letras\n{self.__return_attempts(remaining_attempts)}")
+    def __on_499(self, **extra_info):
+        """
+        Comando inválido.
+        """
+        remaining_attempts = extra_info.get("remaining_attempts")
 
-            case 404:
-                print(f'A palavra não existe no dicionário\n{self.__return_attempts(remaining_attempts)}')
+        print("\033[91m Comando inválido\033[0m")
 
-            case 405:
-                print(f'Palavra já utilizada\n{self.__return_attempts(remaining_attempts)}')
+        if remaining_attempts:
+            print(f'{self.__return_attempts(remaining_attempts)}')
 
-            case 499:
-                print("\033[91m Comando inválido\033[0m")
 
-                if remaining_attempts:
-                    print(f'{self.__return_attempts(remaining_attempts)}')
 
+    def __end_round(self) -> None:
+        """
+        Encerra a rodada atual, perguntando ao usuário se deseja continuar jogando.
+
+        Caso o usuário opte por sair, fecha o socket e encerra o programa.
+        Caso contrário, solicita ao servidor a continuação do jogo.
+        """
+        self.__print_end_game_message()
+
+        if self.__check_exit_game(self.__get_user_end_game_option()):
+            self.__print_goodbye_message()
+            self.__sock.close()
+            sys.exit(0)
+
+        self.__game_continued_action()
 
 
     def __handle_response_status(self, response_status: int, response_data: Dict[str, Any], parameter: Any) -> None:
@@ -489,24 +704,16 @@ class Client:
         remaining_attempts = response_data.get("remaining_attempts")
         if response_status == 200:
             self.__render_response(response_status)
-            self.__game_status = GameStatus.GAME_IN_PROGRESS
+            self.__game_status = _IN_PROGRESS
 
         elif response_status == 201:
             self.__render_response(response_status)
-            self.__game_status = GameStatus.NO_GAME
+            self.__game_status = _NO_GAME
 
         elif response_status == 202:
             self.__render_response(response_status, remaining_attempts=remaining_attempts, rounds_scores=response_data["rounds_scores"], total_score=response_data["total_score"])
 
-            self.__print_end_game_message()
-            option = self.__get_user_end_game_option()
-
-            if self.__check_exit_game(option):
-                self.__print_goodbye_message()
-                self.__sock.close()
-                sys.exit(0)
-
-            self.__game_continued_action()  
+            self.__end_round()
 
         elif response_status == 203:
             color_str = self.__format_output(parameter, response_data["word_encoded"])
@@ -516,15 +723,7 @@ class Client:
             else:
                 self.__render_response(response_status, format_output=color_str, secret_word=response_data["secret_word"], rounds_scores=response_data["rounds_scores"], total_score=response_data["total_score"],remaining_attempts=remaining_attempts)
 
-                self.__print_end_game_message()
-                option = self.__get_user_end_game_option()
-
-                if self.__check_exit_game(option):
-                    self.__print_goodbye_message()
-                    self.__sock.close()
-                    sys.exit(0)
-
-                self.__game_continued_action()
+                self.__end_round()
 
         elif response_status == 206:
             self.__render_response(response_status, player_name=self.__user_name)
@@ -558,9 +757,13 @@ class Client:
                     user_cmd = self.__get_user_command()
 
                     command, parameter = self.__process_user_command(user_cmd)
-                    req_body = self.__create_request_body(command, parameter)
+                    cached_request = self.__cached_requests.get(command)
 
-                    response_data = self.__send_requisition(req_body)
+                    if cached_request is not None:
+                        response_data = self.__send_payload(cached_request)
+                    else:
+                        req_body = self.__create_request_body(command, parameter)
+                        response_data = self.__send_requisition(req_body)
                     response_status = response_data["status_code"]
 
                     self.__handle_response_status(response_status, response_data, parameter)
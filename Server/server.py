@@ -1,13 +1,14 @@
 #pylint: disable= E0611 C0103 W0718
 
 import socket
-import json
 import sys
 from threading import Thread, Lock
 
+import msgpack
+
 from Server import Player, Termo, PlayerNotFoundException, SingletonException
 
-from utils import summary_protocol, server_config
+from utils import summary_protocol, server_config, send_framed, recv_framed
 
 
 class PlayerFactory:
@@ -351,7 +352,7 @@ class Server:
         Processa a mensagem recebida do cliente.
 
         Args:
-            msg (bytes): A mensagem recebida do cliente.
+            msg (memoryview): A mensagem recebida do cliente.
             con (socket): O objeto de conexão do cliente.
             client (str): O identificador do cliente.
 
@@ -362,7 +363,7 @@ class Server:
             Exception: Se ocorrer um erro ao processar a mensagem do cliente.
         """
         try:
-            data = json.loads(msg.decode())
+            data = msgpack.unpackb(msg, raw=False)
             print('Conectei com', client, data)
 
             command = data.get('command').lower()
@@ -392,8 +393,8 @@ class Server:
                 case _:
                     data = self.__invalid_command(current_player)
 
-            response = json.dumps(data)
-            con.sendall(response.encode())
+            response = msgpack.packb(data, use_bin_type=True)
+            send_framed(con, response)
 
         except Exception as e:
             print(f"Erro ao processar mensagem do cliente: {e}")
@@ -410,10 +411,11 @@ class Server:
         - Exception: Se ocorrer um erro ao lidar com o cliente.
         
         """
+        buffer = bytearray(self.__TAM_MSG)
         while True:
             try:
-                msg = con.recv(self.__TAM_MSG)
-                if not msg:
+                msg = recv_framed(con, self.__TAM_MSG, buffer)
+                if msg is None:
                     break
                 self.__process_client_message(msg, con, client)
             except Exception as e:
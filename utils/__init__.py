@@ -1,4 +1,5 @@
 #pylint: disable=E0401
 from .summary_protocol import summary_protocol
 from .server_config import server_config
-from .LinkedStack import LinkedStack
\ No newline at end of file
+from .LinkedStack import LinkedStack
+from .framing import send_framed, recv_framed
@@ -0,0 +1,75 @@
+import socket
+from typing import Optional
+
+HEADER_SIZE = 4
+CHUNK_SIZE = 8192
+
+
+def send_framed(sock: socket.socket, payload: bytes) -> None:
+    """
+    Envia uma mensagem precedida pelo seu tamanho em 4 bytes (big-endian).
+
+    Args:
+        sock (socket.socket): O socket pelo qual a mensagem será enviada.
+        payload (bytes): O conteúdo da mensagem.
+    """
+    sock.sendall(len(payload).to_bytes(HEADER_SIZE, "big") + payload)
+
+
+def _recv_exactly(sock: socket.socket, view: memoryview) -> bool:
+    """
+    Preenche a view com exatamente len(view) bytes lidos do socket, em blocos de até 8 KB.
+
+    Returns:
+        bool: False se a conexão foi encerrada antes de qualquer byte ser lido.
+
+    Raises:
+        ConnectionError: Se a conexão for encerrada no meio da leitura.
+    """
+    offset, remaining = 0, len(view)
+    while remaining:
+        received = sock.recv_into(view[offset:offset + min(CHUNK_SIZE, remaining)])
+        if not received:
+            if offset == 0:
+                return False
+            raise ConnectionError("Conexão encerrada no meio de uma mensagem.")
+        offset += received
+        remaining -= received
+    return True
+
+
+def recv_framed(sock: socket.socket, max_size: int,
+                buffer: Optional[bytearray] = None) -> Optional[memoryview]:
+    """
+    Recebe uma mensagem enviada por send_framed.
+
+    Caso um buffer seja fornecido e comporte a mensagem, ele é reutilizado; caso contrário,
+    um novo buffer do tamanho exato da mensagem é alocado.
+
+    Args:
+        sock (socket.socket): O socket de onde a mensagem será lida.
+        max_size (int): O tamanho máximo aceito para o corpo da mensagem.
+        buffer (bytearray, opcional): Buffer pré-alocado para receber a mensagem.
+
+    Returns:
+        memoryview: O conteúdo da mensagem, ou None se a conexão foi encerrada.
+
+    Raises:
+        ConnectionError: Se a conexão for encerrada no meio de uma mensagem
+            ou se a mensagem exceder max_size.
+    """
+    header = bytearray(HEADER_SIZE)
+    if not _recv_exactly(sock, memoryview(header)):
+        return None
+
+    length = int.from_bytes(header, "big")
+    if length > max_size:
+        raise ConnectionError(f"Mensagem de {length} bytes excede o limite de {max_size} bytes.")
+
+    if buffer is None or len(buffer) < length:
+        buffer = bytearray(length)
+
+    view = memoryview(buffer)[:length]
+    if length and not _recv_exactly(sock, view):
+        raise ConnectionError("Conexão encerrada no meio de uma mensagem.")
+    return view